@@ -11,7 +11,6 @@ from importlib import import_module
 from typing import Callable, Union
 from logging import getLogger, DEBUG
 from base64 import b64encode
-from deepdiff import DeepDiff
 from concurrent.futures import ThreadPoolExecutor
 from threading import Thread, current_thread, main_thread
 from ujson import dumps
@@ -19,7 +18,7 @@ from queue import Queue
 
 from .tdjson import TdJson
 from .handlers import Decorators, Handler
-from .methods import Methods
+from .methods import Methods, Batch
 from .types import Plugins, Result, LogStream, Update
 from .filters import Filter
 from .exception import StopHandlers, AuthorizationError
@@ -341,68 +340,140 @@ class Client(Decorators, Methods):
         """
 
         result = Result(request)
-        self._results[result.id] = result
-
-        if (
-            logger.root.level >= DEBUG
-        ):  # dumping all requests may create performance issues
-            logger.debug("Sending: {}".format(dumps(result.request, indent=4)))
-
-        self.__send(result.request)
+        self.__send_result(result)
         result.wait()
 
         if result.is_error:
-            if result["code"] == 429:
-                retry_after = self.get_retry_after_time(result["message"])
+            self.__retry_result(result)
 
-                if retry_after <= self.sleep_threshold:
-                    result.reset()
+        return result
 
-                    logger.error(
-                        "Sleeping for {}s (Caused by {})".format(
-                            retry_after, result.request["@type"]
-                        )
+    def invoke_many(
+        self,
+        requests: list,
+    ) -> list:
+        """Invoke multiple TDLib requests at once
+
+        All requests are sent back-to-back before waiting for any of them, so ``N`` independent requests cost about one round trip instead of ``N``
+
+        Example:
+            .. code-block:: python
+
+                from pytdbot_sync import Client
+
+                with Client(...) as client:
+                    chat, user = client.invoke_many(
+                        [
+                            {"@type": "getChat", "chat_id": chat_id},
+                            {"@type": "getUser", "user_id": user_id},
+                        ]
                     )
 
-                    time.sleep(retry_after)
-                    self._results[result.id] = result
-                    self.__send(result.request)
-                    result.wait()
-            elif not self.use_message_database and (
-                result["code"] == 400
-                and result["message"] == "Chat not found"
-                and "chat_id" in result.request
-            ):
-                chat_id = result.request["chat_id"]
+        Args:
+            requests (``list``):
+                List of requests to be sent
 
-                logger.debug("Attempt to load chat {}".format(chat_id))
+        Returns:
+            :py:class:`list`: List of :class:`~pytdbot_sync.types.Result` in the same order as ``requests``
+        """
 
-                load_chat = self.getChat(chat_id)
+        # Each result gets its own copy since ``Result`` writes the request id into the dict
+        results = [Result(dict(request)) for request in requests]
+        self._invoke_results(results)
 
-                if not load_chat.is_error:
-                    logger.debug("Chat {} is loaded".format(chat_id))
+        return results
 
-                    message_id = 0
-                    if "reply_to_message_id" in result.request:
-                        message_id = result.request["reply_to_message_id"]
-                    elif "message_id" in result.request:
-                        message_id = result.request["message_id"]
+    def batch(self) -> Batch:
+        """Create a batch of TDLib requests which are sent all at once
 
-                    # If there is a message_id then
-                    # we need to load it to avoid MESSAGE_NOT_FOUND
-                    if message_id > 0:
-                        self.getMessage(chat_id, message_id)
+        If the ``with`` block raises, the requests are not sent and their results are set to a ``"Batch was not sent"`` error
 
-                    # repeat the first request
-                    result.reset()
-                    self._results[result.id] = result
-                    self.__send(result.request)
-                    result.wait()
-                else:
-                    logger.error("Couldn't load chat {}".format(chat_id))
+        Example:
+            .. code-block:: python
+
+                from pytdbot_sync import Client
+
+                with Client(...) as client:
+                    with client.batch() as batch:
+                        title = batch.setChatTitle(chat_id, "New title")
+                        description = batch.setChatDescription(chat_id, "New description")
+
+                    if title.is_error:
+                        print(title["message"])
+
+        Returns:
+            :class:`~pytdbot_sync.methods.Batch`
+        """
+
+        return Batch(self)
+
+    def execute(
+        self,
+        request: dict,
+    ) -> Result:
+        """Execute a TDLib request synchronously
+
+        The request is executed in-process by ``td_execute`` without going through the request queue. Only requests documented as "Can be called synchronously" are supported
+
+        Example:
+            .. code-block:: python
+
+                from pytdbot_sync import Client
+
+                with Client(...) as client:
+                    res = client.execute({"@type": "getFileMimeType", "file_name": "photo.jpg"})
+                    if not res.is_error:
+                        print(res)
+
+        Args:
+            request (``dict``):
+                The request to be executed
+
+        Returns:
+            :class:`~pytdbot_sync.types.Result`
+        """
+
+        result = Result(request)
+
+        # dumping all requests may create performance issues
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(
+                "Executing: {}".format(dumps(result.request, indent=4, default=str))
+            )
+
+        result.set_result(self._tdjson.execute(result.request))
 
         return result
 
+    def invoke_noreply(
+        self,
+        request: dict,
+    ) -> None:
+        """Send a new TDLib request without waiting for its result
+
+        Useful for fire-and-forget requests (e.g. :meth:`~pytdbot_sync.Client.editMessageLiveLocation` or :meth:`~pytdbot_sync.Client.viewMessages`) where the response is discarded anyway. No :class:`~pytdbot_sync.types.Result` is allocated and errors are only logged
+
+        Example:
+            .. code-block:: python
+
+                from pytdbot_sync import Client
+
+                with Client(...) as client:
+                    client.invoke_noreply({"@type": "viewMessages", "chat_id": chat_id, "message_ids": [message_id], "force_read": True})
+
+        Args:
+            request (``dict``):
+                The request to be sent
+        """
+
+        request["@extra"] = {"id": "", "noreply": request["@type"]}
+
+        # dumping all requests may create performance issues
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Sending: {}".format(dumps(request, indent=4, default=str)))
+
+        self.__send(request)
+
     def call_method(self, method: str, **kwargs) -> Result:
         """Call a method. with keyword arguments (``kwargs``) support
 
@@ -491,6 +562,75 @@ class Client(Decorators, Methods):
 
             return True
 
+    def __send_result(self, result: Result) -> None:
+        self._results[result.id] = result
+
+        # dumping all requests may create performance issues
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(
+                "Sending: {}".format(dumps(result.request, indent=4, default=str))
+            )
+
+        self.__send(result.request)
+
+    def _invoke_results(self, results: list) -> None:
+        for result in results:
+            self.__send_result(result)
+
+        for result in results:
+            result.wait()
+
+            if result.is_error:
+                self.__retry_result(result)
+
+    def __retry_result(self, result: Result) -> None:
+        if result["code"] == 429:
+            retry_after = self.get_retry_after_time(result["message"])
+
+            if retry_after <= self.sleep_threshold:
+                result.reset()
+
+                logger.error(
+                    "Sleeping for {}s (Caused by {})".format(
+                        retry_after, result.request["@type"]
+                    )
+                )
+
+                time.sleep(retry_after)
+                self.__send_result(result)
+                result.wait()
+        elif not self.use_message_database and (
+            result["code"] == 400
+            and result["message"] == "Chat not found"
+            and "chat_id" in result.request
+        ):
+            chat_id = result.request["chat_id"]
+
+            logger.debug("Attempt to load chat {}".format(chat_id))
+
+            load_chat = self.getChat(chat_id)
+
+            if not load_chat.is_error:
+                logger.debug("Chat {} is loaded".format(chat_id))
+
+                message_id = 0
+                if "reply_to_message_id" in result.request:
+                    message_id = result.request["reply_to_message_id"]
+                elif "message_id" in result.request:
+                    message_id = result.request["message_id"]
+
+                # If there is a message_id then
+                # we need to load it to avoid MESSAGE_NOT_FOUND
+                if message_id > 0:
+                    self.getMessage(chat_id, message_id)
+
+                # repeat the first request
+                result.reset()
+                self.__send_result(result)
+                result.wait()
+            else:
+                logger.error("Couldn't load chat {}".format(chat_id))
+
     def __send(self, request: dict) -> None:
         return self._tdjson.send(
             request
@@ -591,12 +731,12 @@ class Client(Decorators, Methods):
             logger.error("Unexpected update received: {}".format(update))
             return
         elif "@extra" in update:
-            if (
-                logger.root.level >= DEBUG
-            ):  # dumping all results may create performance issues
+            # dumping all results may create performance issues
+            if logger.isEnabledFor(DEBUG):
                 logger.debug("Recieved: {}".format(dumps(update, indent=4)))
-            if update["@extra"]["id"] in self._results:
-                result: Result = self._results.pop(update["@extra"]["id"])
+            result: Result = self._results.pop(update["@extra"]["id"], None)
+
+            if result is not None:
                 result.set_result(update)
             elif update["@type"] == "error" and "option" in update["@extra"]:
                 logger.error(
@@ -605,6 +745,13 @@ class Client(Decorators, Methods):
                         update["message"],
                     )
                 )
+            elif update["@type"] == "error" and "noreply" in update["@extra"]:
+                logger.error(
+                    "{} failed: {}".format(
+                        update["@extra"]["noreply"],
+                        update["message"],
+                    )
+                )
         else:
             if update["@type"] == "updateAuthorizationState":
                 self.workers.submit(self.__handle_authorization_state, update)
@@ -673,9 +820,8 @@ class Client(Decorators, Methods):
                 if "@type" not in update:
                     return
 
-                if (
-                    logger.root.level >= DEBUG
-                ):  # dumping all updates can create performance issues
+                # dumping all updates can create performance issues
+                if logger.isEnabledFor(DEBUG):
                     logger.debug(
                         "Received: {}".format(dumps(update, indent=4)),
                     )
@@ -817,8 +963,9 @@ class Client(Decorators, Methods):
             update["old_message_id"].__str__() + update["message"]["chat_id"].__str__()
         )
 
-        if m_id in self._results:
-            result: Result = self._results.pop(m_id)
+        result: Result = self._results.pop(m_id, None)
+
+        if result is not None:
             result.set_result(update["message"])
 
     def __handle_update_message_failed(self, update):
@@ -1102,6 +1249,9 @@ def deepdiff(d1, d2):
     if not isinstance(d1, dict) or not isinstance(d2, dict):
         return d1 == d2
 
+    # deepdiff is slow to import and only needed when the current user is updated
+    from deepdiff import DeepDiff
+
     deep = DeepDiff(d1, d2, ignore_order=True, view="tree")
 
     for parent in deep.keys():
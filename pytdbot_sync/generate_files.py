@@ -141,9 +141,23 @@ def functions():
                 )
             )
             f.write(f"        data = {{'@type': '{k}',")
-            for k in v["args"]:
-                f.write(f" '{k}': {k},")
-            f.write("}\n\n        return self.invoke(data)\n\n")
+            for arg, arg_v in v["args"].items():
+                if not arg_v["is_optional"]:
+                    f.write(f" '{arg}': {arg},")
+            f.write("}\n\n")
+
+            # TDLib treats missing fields as null, so don't send optional ones unless set
+            for arg, arg_v in v["args"].items():
+                if arg_v["is_optional"]:
+                    f.write(
+                        f"        if {arg} is not None:\n            data['{arg}'] = {arg}\n\n"
+                    )
+
+            if v["description"].endswith("Can be called synchronously"):
+                # Executed in-process by td_execute, skipping the request queue
+                f.write("        return self.execute(data)\n\n")
+            else:
+                f.write("        return self.invoke(data)\n\n")
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
-__all__ = ["Methods"]
+__all__ = ["Methods", "Batch"]
 
 from .methods import Methods
+from .batch import Batch
@@ -0,0 +1,82 @@
+import pytdbot_sync
+
+from .tdlibfunctions import TDLibFunctions
+from ..types import Result
+
+
+class Batch(TDLibFunctions):
+    """Collect TDLib requests and send them all at once
+
+    Every TDLib function called on a batch returns a pending :class:`~pytdbot_sync.types.Result` which is filled once the batch is sent.
+    The requests are sent back-to-back when the ``with`` block exits, so ``N`` requests cost about one round trip instead of ``N``.
+    If the ``with`` block raises, nothing is sent and every collected result is set to a ``"Batch was not sent"`` error
+
+    Example:
+        .. code-block:: python
+
+            from pytdbot_sync import Client
+
+            with Client(...) as client:
+                with client.batch() as batch:
+                    title = batch.setChatTitle(chat_id, "New title")
+                    description = batch.setChatDescription(chat_id, "New description")
+
+                if title.is_error:
+                    print(title["message"])
+
+    Args:
+        client (:class:`~pytdbot_sync.Client`):
+            The client used to send the requests
+    """
+
+    def __init__(self, client: "pytdbot_sync.Client") -> None:
+        self.client = client
+        self.results = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.send()
+        else:
+            self.cancel()
+
+    def invoke(self, request: dict) -> Result:
+        # Copy the request so the same dict can be added more than once
+        result = Result(dict(request))
+        self.results.append(result)
+        return result
+
+    def execute(self, request: dict) -> Result:
+        # Synchronous requests have no round trip to save, so run them right away
+        return self.client.execute(request)
+
+    def send(self) -> list:
+        """Send all the collected requests and wait for their results
+
+        Returns:
+            :py:class:`list`: List of :class:`~pytdbot_sync.types.Result` in the order they were added
+        """
+
+        results, self.results = self.results, []
+        self.client._invoke_results(results)
+
+        return results
+
+    def cancel(self) -> list:
+        """Drop all the collected requests without sending them
+
+        Every pending :class:`~pytdbot_sync.types.Result` is set to an error with code ``400``, so waiting on it never blocks
+
+        Returns:
+            :py:class:`list`: List of the cancelled :class:`~pytdbot_sync.types.Result`
+        """
+
+        results, self.results = self.results, []
+        for result in results:
+            result.set_result(
+                {"@type": "error", "code": 400, "message": "Batch was not sent"}
+            )
+
+        return results
@@ -1582,4 +1582,4 @@ class Methods(TDLibFunctions):
             "parse_mode": _data,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
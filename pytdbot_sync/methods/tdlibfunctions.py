@@ -135,9 +135,11 @@ class TDLibFunctions:
         data = {
             "@type": "setAuthenticationPhoneNumber",
             "phone_number": phone_number,
-            "settings": settings,
         }
 
+        if settings is not None:
+            data["settings"] = settings
+
         return self.invoke(data)
 
     def setAuthenticationEmailAddress(self, email_address: str) -> Result:
@@ -342,10 +344,14 @@ class TDLibFunctions:
         data = {
             "@type": "recoverAuthenticationPassword",
             "recovery_code": recovery_code,
-            "new_password": new_password,
-            "new_hint": new_hint,
         }
 
+        if new_password is not None:
+            data["new_password"] = new_password
+
+        if new_hint is not None:
+            data["new_hint"] = new_hint
+
         return self.invoke(data)
 
     def sendAuthenticationFirebaseSms(self, token: str) -> Result:
@@ -528,12 +534,18 @@ class TDLibFunctions:
         data = {
             "@type": "setPassword",
             "old_password": old_password,
-            "new_password": new_password,
-            "new_hint": new_hint,
             "set_recovery_email_address": set_recovery_email_address,
-            "new_recovery_email_address": new_recovery_email_address,
         }
 
+        if new_password is not None:
+            data["new_password"] = new_password
+
+        if new_hint is not None:
+            data["new_hint"] = new_hint
+
+        if new_recovery_email_address is not None:
+            data["new_recovery_email_address"] = new_recovery_email_address
+
         return self.invoke(data)
 
     def setLoginEmailAddress(self, new_login_email_address: str) -> Result:
@@ -721,10 +733,14 @@ class TDLibFunctions:
         data = {
             "@type": "recoverPassword",
             "recovery_code": recovery_code,
-            "new_password": new_password,
-            "new_hint": new_hint,
         }
 
+        if new_password is not None:
+            data["new_password"] = new_password
+
+        if new_hint is not None:
+            data["new_hint"] = new_hint
+
         return self.invoke(data)
 
     def resetPassword(self) -> Result:
@@ -1181,9 +1197,11 @@ class TDLibFunctions:
         data = {
             "@type": "getRemoteFile",
             "remote_file_id": remote_file_id,
-            "file_type": file_type,
         }
 
+        if file_type is not None:
+            data["file_type"] = file_type
+
         return self.invoke(data)
 
     def loadChats(self, limit: int, chat_list: dict = None) -> Result:
@@ -1203,10 +1221,12 @@ class TDLibFunctions:
 
         data = {
             "@type": "loadChats",
-            "chat_list": chat_list,
             "limit": limit,
         }
 
+        if chat_list is not None:
+            data["chat_list"] = chat_list
+
         return self.invoke(data)
 
     def getChats(self, limit: int, chat_list: dict = None) -> Result:
@@ -1226,10 +1246,12 @@ class TDLibFunctions:
 
         data = {
             "@type": "getChats",
-            "chat_list": chat_list,
             "limit": limit,
         }
 
+        if chat_list is not None:
+            data["chat_list"] = chat_list
+
         return self.invoke(data)
 
     def searchPublicChat(self, username: str) -> Result:
@@ -1749,14 +1771,18 @@ class TDLibFunctions:
             "@type": "searchChatMessages",
             "chat_id": chat_id,
             "query": query,
-            "sender_id": sender_id,
             "from_message_id": from_message_id,
             "offset": offset,
             "limit": limit,
-            "filter": filter,
             "message_thread_id": message_thread_id,
         }
 
+        if sender_id is not None:
+            data["sender_id"] = sender_id
+
+        if filter is not None:
+            data["filter"] = filter
+
         return self.invoke(data)
 
     def searchMessages(
@@ -1800,15 +1826,19 @@ class TDLibFunctions:
 
         data = {
             "@type": "searchMessages",
-            "chat_list": chat_list,
             "query": query,
             "offset": offset,
             "limit": limit,
-            "filter": filter,
             "min_date": min_date,
             "max_date": max_date,
         }
 
+        if chat_list is not None:
+            data["chat_list"] = chat_list
+
+        if filter is not None:
+            data["filter"] = filter
+
         return self.invoke(data)
 
     def searchSecretMessages(
@@ -1843,9 +1873,11 @@ class TDLibFunctions:
             "query": query,
             "offset": offset,
             "limit": limit,
-            "filter": filter,
         }
 
+        if filter is not None:
+            data["filter"] = filter
+
         return self.invoke(data)
 
     def searchCallMessages(self, offset: str, limit: int, only_missed: bool) -> Result:
@@ -2498,11 +2530,15 @@ class TDLibFunctions:
             "chat_id": chat_id,
             "message_thread_id": message_thread_id,
             "reply_to_message_id": reply_to_message_id,
-            "options": options,
-            "reply_markup": reply_markup,
             "input_message_content": input_message_content,
         }
 
+        if options is not None:
+            data["options"] = options
+
+        if reply_markup is not None:
+            data["reply_markup"] = reply_markup
+
         return self.invoke(data)
 
     def sendMessageAlbum(
@@ -2545,11 +2581,13 @@ class TDLibFunctions:
             "chat_id": chat_id,
             "message_thread_id": message_thread_id,
             "reply_to_message_id": reply_to_message_id,
-            "options": options,
             "input_message_contents": input_message_contents,
             "only_preview": only_preview,
         }
 
+        if options is not None:
+            data["options"] = options
+
         return self.invoke(data)
 
     def sendBotStartMessage(
@@ -2625,12 +2663,14 @@ class TDLibFunctions:
             "chat_id": chat_id,
             "message_thread_id": message_thread_id,
             "reply_to_message_id": reply_to_message_id,
-            "options": options,
             "query_id": query_id,
             "result_id": result_id,
             "hide_via_bot": hide_via_bot,
         }
 
+        if options is not None:
+            data["options"] = options
+
         return self.invoke(data)
 
     def forwardMessages(
@@ -2682,12 +2722,14 @@ class TDLibFunctions:
             "message_thread_id": message_thread_id,
             "from_chat_id": from_chat_id,
             "message_ids": message_ids,
-            "options": options,
             "send_copy": send_copy,
             "remove_caption": remove_caption,
             "only_preview": only_preview,
         }
 
+        if options is not None:
+            data["options"] = options
+
         return self.invoke(data)
 
     def resendMessages(self, chat_id: int, message_ids: list) -> Result:
@@ -2888,10 +2930,12 @@ class TDLibFunctions:
             "@type": "editMessageText",
             "chat_id": chat_id,
             "message_id": message_id,
-            "reply_markup": reply_markup,
             "input_message_content": input_message_content,
         }
 
+        if reply_markup is not None:
+            data["reply_markup"] = reply_markup
+
         return self.invoke(data)
 
     def editMessageLiveLocation(
@@ -2933,12 +2977,16 @@ class TDLibFunctions:
             "@type": "editMessageLiveLocation",
             "chat_id": chat_id,
             "message_id": message_id,
-            "reply_markup": reply_markup,
-            "location": location,
             "heading": heading,
             "proximity_alert_radius": proximity_alert_radius,
         }
 
+        if reply_markup is not None:
+            data["reply_markup"] = reply_markup
+
+        if location is not None:
+            data["location"] = location
+
         return self.invoke(data)
 
     def editMessageMedia(
@@ -2972,10 +3020,12 @@ class TDLibFunctions:
             "@type": "editMessageMedia",
             "chat_id": chat_id,
             "message_id": message_id,
-            "reply_markup": reply_markup,
             "input_message_content": input_message_content,
         }
 
+        if reply_markup is not None:
+            data["reply_markup"] = reply_markup
+
         return self.invoke(data)
 
     def editMessageCaption(
@@ -3009,10 +3059,14 @@ class TDLibFunctions:
             "@type": "editMessageCaption",
             "chat_id": chat_id,
             "message_id": message_id,
-            "reply_markup": reply_markup,
-            "caption": caption,
         }
 
+        if reply_markup is not None:
+            data["reply_markup"] = reply_markup
+
+        if caption is not None:
+            data["caption"] = caption
+
         return self.invoke(data)
 
     def editMessageReplyMarkup(
@@ -3039,9 +3093,11 @@ class TDLibFunctions:
             "@type": "editMessageReplyMarkup",
             "chat_id": chat_id,
             "message_id": message_id,
-            "reply_markup": reply_markup,
         }
 
+        if reply_markup is not None:
+            data["reply_markup"] = reply_markup
+
         return self.invoke(data)
 
     def editInlineMessageText(
@@ -3070,10 +3126,12 @@ class TDLibFunctions:
         data = {
             "@type": "editInlineMessageText",
             "inline_message_id": inline_message_id,
-            "reply_markup": reply_markup,
             "input_message_content": input_message_content,
         }
 
+        if reply_markup is not None:
+            data["reply_markup"] = reply_markup
+
         return self.invoke(data)
 
     def editInlineMessageLiveLocation(
@@ -3110,12 +3168,16 @@ class TDLibFunctions:
         data = {
             "@type": "editInlineMessageLiveLocation",
             "inline_message_id": inline_message_id,
-            "reply_markup": reply_markup,
-            "location": location,
             "heading": heading,
             "proximity_alert_radius": proximity_alert_radius,
         }
 
+        if reply_markup is not None:
+            data["reply_markup"] = reply_markup
+
+        if location is not None:
+            data["location"] = location
+
         return self.invoke(data)
 
     def editInlineMessageMedia(
@@ -3144,10 +3206,12 @@ class TDLibFunctions:
         data = {
             "@type": "editInlineMessageMedia",
             "inline_message_id": inline_message_id,
-            "reply_markup": reply_markup,
             "input_message_content": input_message_content,
         }
 
+        if reply_markup is not None:
+            data["reply_markup"] = reply_markup
+
         return self.invoke(data)
 
     def editInlineMessageCaption(
@@ -3173,10 +3237,14 @@ class TDLibFunctions:
         data = {
             "@type": "editInlineMessageCaption",
             "inline_message_id": inline_message_id,
-            "reply_markup": reply_markup,
-            "caption": caption,
         }
 
+        if reply_markup is not None:
+            data["reply_markup"] = reply_markup
+
+        if caption is not None:
+            data["caption"] = caption
+
         return self.invoke(data)
 
     def editInlineMessageReplyMarkup(
@@ -3199,9 +3267,11 @@ class TDLibFunctions:
         data = {
             "@type": "editInlineMessageReplyMarkup",
             "inline_message_id": inline_message_id,
-            "reply_markup": reply_markup,
         }
 
+        if reply_markup is not None:
+            data["reply_markup"] = reply_markup
+
         return self.invoke(data)
 
     def editMessageSchedulingState(
@@ -3228,9 +3298,11 @@ class TDLibFunctions:
             "@type": "editMessageSchedulingState",
             "chat_id": chat_id,
             "message_id": message_id,
-            "scheduling_state": scheduling_state,
         }
 
+        if scheduling_state is not None:
+            data["scheduling_state"] = scheduling_state
+
         return self.invoke(data)
 
     def getForumTopicDefaultIcons(self) -> Result:
@@ -3747,11 +3819,13 @@ class TDLibFunctions:
             "@type": "getMessageAddedReactions",
             "chat_id": chat_id,
             "message_id": message_id,
-            "reaction_type": reaction_type,
             "offset": offset,
             "limit": limit,
         }
 
+        if reaction_type is not None:
+            data["reaction_type"] = reaction_type
+
         return self.invoke(data)
 
     def setDefaultReactionType(self, reaction_type: dict) -> Result:
@@ -3790,7 +3864,7 @@ class TDLibFunctions:
             "text": text,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def parseTextEntities(self, text: str, parse_mode: dict) -> Result:
         """Parses Bold, Italic, Underline, Strikethrough, Spoiler, CustomEmoji, Code, Pre, PreCode, TextUrl and MentionName entities from a marked\-up text\. Can be called synchronously
@@ -3813,7 +3887,7 @@ class TDLibFunctions:
             "parse_mode": parse_mode,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def parseMarkdown(self, text: dict) -> Result:
         """Parses Markdown entities in a human\-friendly format, ignoring markup errors\. Can be called synchronously
@@ -3832,7 +3906,7 @@ class TDLibFunctions:
             "text": text,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def getMarkdownText(self, text: dict) -> Result:
         """Replaces text entities with Markdown formatting in a human\-friendly format\. Entities that can't be represented in Markdown unambiguously are kept as is\. Can be called synchronously
@@ -3851,7 +3925,7 @@ class TDLibFunctions:
             "text": text,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def getFileMimeType(self, file_name: str) -> Result:
         """Returns the MIME type of a file, guessed by its extension\. Returns an empty string on failure\. Can be called synchronously
@@ -3870,7 +3944,7 @@ class TDLibFunctions:
             "file_name": file_name,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def getFileExtension(self, mime_type: str) -> Result:
         """Returns the extension of a file, guessed by its MIME type\. Returns an empty string on failure\. Can be called synchronously
@@ -3889,7 +3963,7 @@ class TDLibFunctions:
             "mime_type": mime_type,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def cleanFileName(self, file_name: str) -> Result:
         """Removes potentially dangerous characters from the name of a file\. The encoding of the file name is supposed to be UTF\-8\. Returns an empty string on failure\. Can be called synchronously
@@ -3908,7 +3982,7 @@ class TDLibFunctions:
             "file_name": file_name,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def getLanguagePackString(
         self,
@@ -3945,7 +4019,7 @@ class TDLibFunctions:
             "key": key,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def getJsonValue(self, json: str) -> Result:
         """Converts a JSON\-serialized string to corresponding JsonValue object\. Can be called synchronously
@@ -3964,7 +4038,7 @@ class TDLibFunctions:
             "json": json,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def getJsonString(self, json_value: dict) -> Result:
         """Converts a JsonValue object to corresponding JSON\-serialized string\. Can be called synchronously
@@ -3983,7 +4057,7 @@ class TDLibFunctions:
             "json_value": json_value,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def getThemeParametersJsonString(self, theme: dict) -> Result:
         """Converts a themeParameters object to corresponding JSON\-serialized string\. Can be called synchronously
@@ -4002,7 +4076,7 @@ class TDLibFunctions:
             "theme": theme,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def setPollAnswer(self, chat_id: int, message_id: int, option_ids: list) -> Result:
         """Changes the user answer to a poll\. A poll in quiz mode can be answered only once
@@ -4092,9 +4166,11 @@ class TDLibFunctions:
             "@type": "stopPoll",
             "chat_id": chat_id,
             "message_id": message_id,
-            "reply_markup": reply_markup,
         }
 
+        if reply_markup is not None:
+            data["reply_markup"] = reply_markup
+
         return self.invoke(data)
 
     def hideSuggestedAction(self, action: dict) -> Result:
@@ -4295,11 +4371,13 @@ class TDLibFunctions:
             "@type": "getInlineQueryResults",
             "bot_user_id": bot_user_id,
             "chat_id": chat_id,
-            "user_location": user_location,
             "query": query,
             "offset": offset,
         }
 
+        if user_location is not None:
+            data["user_location"] = user_location
+
         return self.invoke(data)
 
     def answerInlineQuery(
@@ -4341,12 +4419,14 @@ class TDLibFunctions:
             "@type": "answerInlineQuery",
             "inline_query_id": inline_query_id,
             "is_personal": is_personal,
-            "button": button,
             "results": results,
             "cache_time": cache_time,
             "next_offset": next_offset,
         }
 
+        if button is not None:
+            data["button"] = button
+
         return self.invoke(data)
 
     def searchWebApp(self, bot_user_id: int, web_app_short_name: str) -> Result:
@@ -4417,11 +4497,13 @@ class TDLibFunctions:
             "bot_user_id": bot_user_id,
             "web_app_short_name": web_app_short_name,
             "start_parameter": start_parameter,
-            "theme": theme,
             "application_name": application_name,
             "allow_write_access": allow_write_access,
         }
 
+        if theme is not None:
+            data["theme"] = theme
+
         return self.invoke(data)
 
     def getWebAppUrl(
@@ -4451,10 +4533,12 @@ class TDLibFunctions:
             "@type": "getWebAppUrl",
             "bot_user_id": bot_user_id,
             "url": url,
-            "theme": theme,
             "application_name": application_name,
         }
 
+        if theme is not None:
+            data["theme"] = theme
+
         return self.invoke(data)
 
     def sendWebAppData(self, bot_user_id: int, button_text: str, data: str) -> Result:
@@ -4528,12 +4612,14 @@ class TDLibFunctions:
             "chat_id": chat_id,
             "bot_user_id": bot_user_id,
             "url": url,
-            "theme": theme,
             "application_name": application_name,
             "message_thread_id": message_thread_id,
             "reply_to_message_id": reply_to_message_id,
         }
 
+        if theme is not None:
+            data["theme"] = theme
+
         return self.invoke(data)
 
     def closeWebApp(self, web_app_launch_id: int) -> Result:
@@ -4889,9 +4975,11 @@ class TDLibFunctions:
             "@type": "sendChatAction",
             "chat_id": chat_id,
             "message_thread_id": message_thread_id,
-            "action": action,
         }
 
+        if action is not None:
+            data["action"] = action
+
         return self.invoke(data)
 
     def openChat(self, chat_id: int) -> Result:
@@ -4959,10 +5047,12 @@ class TDLibFunctions:
             "@type": "viewMessages",
             "chat_id": chat_id,
             "message_ids": message_ids,
-            "source": source,
             "force_read": force_read,
         }
 
+        if source is not None:
+            data["source"] = source
+
         return self.invoke(data)
 
     def openMessageContent(self, chat_id: int, message_id: int) -> Result:
@@ -5293,11 +5383,13 @@ class TDLibFunctions:
 
         data = {
             "@type": "createNewBasicGroupChat",
-            "user_ids": user_ids,
             "title": title,
             "message_auto_delete_time": message_auto_delete_time,
         }
 
+        if user_ids is not None:
+            data["user_ids"] = user_ids
+
         return self.invoke(data)
 
     def createNewSupergroupChat(
@@ -5345,11 +5437,13 @@ class TDLibFunctions:
             "is_forum": is_forum,
             "is_channel": is_channel,
             "description": description,
-            "location": location,
             "message_auto_delete_time": message_auto_delete_time,
             "for_import": for_import,
         }
 
+        if location is not None:
+            data["location"] = location
+
         return self.invoke(data)
 
     def createNewSecretChat(self, user_id: int) -> Result:
@@ -5591,7 +5685,7 @@ class TDLibFunctions:
             "folder": folder,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def getChatsForChatFolderInviteLink(self, chat_folder_id: int) -> Result:
         """Returns identifiers of chats from a chat folder, suitable for adding to a chat folder invite link
@@ -5845,9 +5939,11 @@ class TDLibFunctions:
         data = {
             "@type": "setChatPhoto",
             "chat_id": chat_id,
-            "photo": photo,
         }
 
+        if photo is not None:
+            data["photo"] = photo
+
         return self.invoke(data)
 
     def setChatMessageAutoDeleteTime(
@@ -5928,11 +6024,15 @@ class TDLibFunctions:
         data = {
             "@type": "setChatBackground",
             "chat_id": chat_id,
-            "background": background,
-            "type": type,
             "dark_theme_dimming": dark_theme_dimming,
         }
 
+        if background is not None:
+            data["background"] = background
+
+        if type is not None:
+            data["type"] = type
+
         return self.invoke(data)
 
     def setChatTheme(self, chat_id: int, theme_name: str) -> Result:
@@ -5982,9 +6082,11 @@ class TDLibFunctions:
             "@type": "setChatDraftMessage",
             "chat_id": chat_id,
             "message_thread_id": message_thread_id,
-            "draft_message": draft_message,
         }
 
+        if draft_message is not None:
+            data["draft_message"] = draft_message
+
         return self.invoke(data)
 
     def setChatNotificationSettings(
@@ -6602,9 +6704,11 @@ class TDLibFunctions:
             "chat_id": chat_id,
             "query": query,
             "limit": limit,
-            "filter": filter,
         }
 
+        if filter is not None:
+            data["filter"] = filter
+
         return self.invoke(data)
 
     def getChatAdministrators(self, chat_id: int) -> Result:
@@ -6735,10 +6839,12 @@ class TDLibFunctions:
 
         data = {
             "@type": "getChatNotificationSettingsExceptions",
-            "scope": scope,
             "compare_sound": compare_sound,
         }
 
+        if scope is not None:
+            data["scope"] = scope
+
         return self.invoke(data)
 
     def getScopeNotificationSettings(self, scope: dict) -> Result:
@@ -7103,10 +7209,12 @@ class TDLibFunctions:
         data = {
             "@type": "preliminaryUploadFile",
             "file": file,
-            "file_type": file_type,
             "priority": priority,
         }
 
+        if file_type is not None:
+            data["file_type"] = file_type
+
         return self.invoke(data)
 
     def cancelPreliminaryUploadFile(self, file_id: int) -> Result:
@@ -7204,9 +7312,11 @@ class TDLibFunctions:
         data = {
             "@type": "finishFileGeneration",
             "generation_id": generation_id,
-            "error": error,
         }
 
+        if error is not None:
+            data["error"] = error
+
         return self.invoke(data)
 
     def readFilePart(self, file_id: int, offset: int, count: int) -> Result:
@@ -7415,13 +7525,15 @@ class TDLibFunctions:
 
         data = {
             "@type": "searchFileDownloads",
-            "query": query,
             "only_active": only_active,
             "only_completed": only_completed,
             "offset": offset,
             "limit": limit,
         }
 
+        if query is not None:
+            data["query"] = query
+
         return self.invoke(data)
 
     def getMessageFileType(self, message_file_head: str) -> Result:
@@ -7715,10 +7827,12 @@ class TDLibFunctions:
             "@type": "getChatInviteLinkMembers",
             "chat_id": chat_id,
             "invite_link": invite_link,
-            "offset_member": offset_member,
             "limit": limit,
         }
 
+        if offset_member is not None:
+            data["offset_member"] = offset_member
+
         return self.invoke(data)
 
     def revokeChatInviteLink(self, chat_id: int, invite_link: str) -> Result:
@@ -7866,10 +7980,12 @@ class TDLibFunctions:
             "chat_id": chat_id,
             "invite_link": invite_link,
             "query": query,
-            "offset_request": offset_request,
             "limit": limit,
         }
 
+        if offset_request is not None:
+            data["offset_request"] = offset_request
+
         return self.invoke(data)
 
     def processChatJoinRequest(
@@ -8344,14 +8460,18 @@ class TDLibFunctions:
         data = {
             "@type": "joinGroupCall",
             "group_call_id": group_call_id,
-            "participant_id": participant_id,
             "audio_source_id": audio_source_id,
             "payload": payload,
             "is_muted": is_muted,
             "is_my_video_enabled": is_my_video_enabled,
-            "invite_hash": invite_hash,
         }
 
+        if participant_id is not None:
+            data["participant_id"] = participant_id
+
+        if invite_hash is not None:
+            data["invite_hash"] = invite_hash
+
         return self.invoke(data)
 
     def startGroupCallScreenSharing(
@@ -8881,9 +9001,11 @@ class TDLibFunctions:
             "time_offset": time_offset,
             "scale": scale,
             "channel_id": channel_id,
-            "video_quality": video_quality,
         }
 
+        if video_quality is not None:
+            data["video_quality"] = video_quality
+
         return self.invoke(data)
 
     def toggleMessageSenderIsBlocked(self, sender_id: dict, is_blocked: bool) -> Result:
@@ -9042,10 +9164,12 @@ class TDLibFunctions:
 
         data = {
             "@type": "searchContacts",
-            "query": query,
             "limit": limit,
         }
 
+        if query is not None:
+            data["query"] = query
+
         return self.invoke(data)
 
     def removeContacts(self, user_ids: list) -> Result:
@@ -9132,9 +9256,11 @@ class TDLibFunctions:
         data = {
             "@type": "setUserPersonalProfilePhoto",
             "user_id": user_id,
-            "photo": photo,
         }
 
+        if photo is not None:
+            data["photo"] = photo
+
         return self.invoke(data)
 
     def suggestUserProfilePhoto(self, user_id: int, photo: dict) -> Result:
@@ -9738,9 +9864,11 @@ class TDLibFunctions:
             "@type": "searchEmojis",
             "text": text,
             "exact_match": exact_match,
-            "input_language_codes": input_language_codes,
         }
 
+        if input_language_codes is not None:
+            data["input_language_codes"] = input_language_codes
+
         return self.invoke(data)
 
     def getEmojiCategories(self, type: dict = None) -> Result:
@@ -9757,9 +9885,11 @@ class TDLibFunctions:
 
         data = {
             "@type": "getEmojiCategories",
-            "type": type,
         }
 
+        if type is not None:
+            data["type"] = type
+
         return self.invoke(data)
 
     def getAnimatedEmoji(self, emoji: str) -> Result:
@@ -10159,10 +10289,12 @@ class TDLibFunctions:
 
         data = {
             "@type": "setEmojiStatus",
-            "emoji_status": emoji_status,
             "duration": duration,
         }
 
+        if emoji_status is not None:
+            data["emoji_status"] = emoji_status
+
         return self.invoke(data)
 
     def setLocation(self, location: dict) -> Result:
@@ -10202,9 +10334,11 @@ class TDLibFunctions:
         data = {
             "@type": "changePhoneNumber",
             "phone_number": phone_number,
-            "settings": settings,
         }
 
+        if settings is not None:
+            data["settings"] = settings
+
         return self.invoke(data)
 
     def resendChangePhoneNumberCode(self) -> Result:
@@ -10295,11 +10429,13 @@ class TDLibFunctions:
 
         data = {
             "@type": "setCommands",
-            "scope": scope,
             "language_code": language_code,
             "commands": commands,
         }
 
+        if scope is not None:
+            data["scope"] = scope
+
         return self.invoke(data)
 
     def deleteCommands(self, language_code: str, scope: dict = None) -> Result:
@@ -10319,10 +10455,12 @@ class TDLibFunctions:
 
         data = {
             "@type": "deleteCommands",
-            "scope": scope,
             "language_code": language_code,
         }
 
+        if scope is not None:
+            data["scope"] = scope
+
         return self.invoke(data)
 
     def getCommands(self, language_code: str, scope: dict = None) -> Result:
@@ -10342,10 +10480,12 @@ class TDLibFunctions:
 
         data = {
             "@type": "getCommands",
-            "scope": scope,
             "language_code": language_code,
         }
 
+        if scope is not None:
+            data["scope"] = scope
+
         return self.invoke(data)
 
     def setMenuButton(self, user_id: int, menu_button: dict) -> Result:
@@ -10406,9 +10546,13 @@ class TDLibFunctions:
 
         data = {
             "@type": "setDefaultGroupAdministratorRights",
-            "default_group_administrator_rights": default_group_administrator_rights,
         }
 
+        if default_group_administrator_rights is not None:
+            data["default_group_administrator_rights"] = (
+                default_group_administrator_rights
+            )
+
         return self.invoke(data)
 
     def setDefaultChannelAdministratorRights(
@@ -10427,9 +10571,13 @@ class TDLibFunctions:
 
         data = {
             "@type": "setDefaultChannelAdministratorRights",
-            "default_channel_administrator_rights": default_channel_administrator_rights,
         }
 
+        if default_channel_administrator_rights is not None:
+            data["default_channel_administrator_rights"] = (
+                default_channel_administrator_rights
+            )
+
         return self.invoke(data)
 
     def setBotName(self, bot_user_id: int, language_code: str, name: str) -> Result:
@@ -10500,9 +10648,11 @@ class TDLibFunctions:
         data = {
             "@type": "setBotProfilePhoto",
             "bot_user_id": bot_user_id,
-            "photo": photo,
         }
 
+        if photo is not None:
+            data["photo"] = photo
+
         return self.invoke(data)
 
     def toggleBotUsernameIsActive(
@@ -11213,11 +11363,13 @@ class TDLibFunctions:
         data = {
             "@type": "getSupergroupMembers",
             "supergroup_id": supergroup_id,
-            "filter": filter,
             "offset": offset,
             "limit": limit,
         }
 
+        if filter is not None:
+            data["filter"] = filter
+
         return self.invoke(data)
 
     def closeSecretChat(self, secret_chat_id: int) -> Result:
@@ -11280,10 +11432,12 @@ class TDLibFunctions:
             "query": query,
             "from_event_id": from_event_id,
             "limit": limit,
-            "filters": filters,
             "user_ids": user_ids,
         }
 
+        if filters is not None:
+            data["filters"] = filters
+
         return self.invoke(data)
 
     def getPaymentForm(self, input_invoice: dict, theme: dict = None) -> Result:
@@ -11304,9 +11458,11 @@ class TDLibFunctions:
         data = {
             "@type": "getPaymentForm",
             "input_invoice": input_invoice,
-            "theme": theme,
         }
 
+        if theme is not None:
+            data["theme"] = theme
+
         return self.invoke(data)
 
     def validateOrderInfo(
@@ -11332,10 +11488,12 @@ class TDLibFunctions:
         data = {
             "@type": "validateOrderInfo",
             "input_invoice": input_invoice,
-            "order_info": order_info,
             "allow_save": allow_save,
         }
 
+        if order_info is not None:
+            data["order_info"] = order_info
+
         return self.invoke(data)
 
     def sendPaymentForm(
@@ -11566,11 +11724,15 @@ class TDLibFunctions:
 
         data = {
             "@type": "setBackground",
-            "background": background,
-            "type": type,
             "for_dark_theme": for_dark_theme,
         }
 
+        if background is not None:
+            data["background"] = background
+
+        if type is not None:
+            data["type"] = type
+
         return self.invoke(data)
 
     def removeBackground(self, background_id: int) -> Result:
@@ -11850,7 +12012,7 @@ class TDLibFunctions:
             "payload": payload,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def getRecentlyVisitedTMeUrls(self, referrer: str) -> Result:
         """Returns t\.me URLs recently visited by a newly registered user
@@ -11950,9 +12112,11 @@ class TDLibFunctions:
         data = {
             "@type": "setOption",
             "name": name,
-            "value": value,
         }
 
+        if value is not None:
+            data["value"] = value
+
         return self.invoke(data)
 
     def setAccountTtl(self, ttl: dict) -> Result:
@@ -12089,11 +12253,13 @@ class TDLibFunctions:
         data = {
             "@type": "reportChat",
             "chat_id": chat_id,
-            "message_ids": message_ids,
             "reason": reason,
             "text": text,
         }
 
+        if message_ids is not None:
+            data["message_ids"] = message_ids
+
         return self.invoke(data)
 
     def reportChatPhoto(
@@ -12337,13 +12503,19 @@ class TDLibFunctions:
             "ttl": ttl,
             "count": count,
             "immunity_delay": immunity_delay,
-            "file_types": file_types,
-            "chat_ids": chat_ids,
-            "exclude_chat_ids": exclude_chat_ids,
             "return_deleted_file_statistics": return_deleted_file_statistics,
             "chat_limit": chat_limit,
         }
 
+        if file_types is not None:
+            data["file_types"] = file_types
+
+        if chat_ids is not None:
+            data["chat_ids"] = chat_ids
+
+        if exclude_chat_ids is not None:
+            data["exclude_chat_ids"] = exclude_chat_ids
+
         return self.invoke(data)
 
     def setNetworkType(self, type: dict = None) -> Result:
@@ -12360,9 +12532,11 @@ class TDLibFunctions:
 
         data = {
             "@type": "setNetworkType",
-            "type": type,
         }
 
+        if type is not None:
+            data["type"] = type
+
         return self.invoke(data)
 
     def getNetworkStatistics(self, only_current: bool) -> Result:
@@ -12486,9 +12660,11 @@ class TDLibFunctions:
         data = {
             "@type": "setAutosaveSettings",
             "scope": scope,
-            "settings": settings,
         }
 
+        if settings is not None:
+            data["settings"] = settings
+
         return self.invoke(data)
 
     def clearAutosaveSettingsExceptions(self) -> Result:
@@ -12670,9 +12846,11 @@ class TDLibFunctions:
         data = {
             "@type": "sendPhoneNumberVerificationCode",
             "phone_number": phone_number,
-            "settings": settings,
         }
 
+        if settings is not None:
+            data["settings"] = settings
+
         return self.invoke(data)
 
     def resendPhoneNumberVerificationCode(self) -> Result:
@@ -12867,9 +13045,11 @@ class TDLibFunctions:
             "@type": "sendPhoneNumberConfirmationCode",
             "hash": hash,
             "phone_number": phone_number,
-            "settings": settings,
         }
 
+        if settings is not None:
+            data["settings"] = settings
+
         return self.invoke(data)
 
     def resendPhoneNumberConfirmationCode(self) -> Result:
@@ -13049,9 +13229,11 @@ class TDLibFunctions:
             "sticker_type": sticker_type,
             "needs_repainting": needs_repainting,
             "stickers": stickers,
-            "source": source,
         }
 
+        if source is not None:
+            data["source"] = source
+
         return self.invoke(data)
 
     def addStickerToSet(self, user_id: int, name: str, sticker: dict) -> Result:
@@ -13105,9 +13287,11 @@ class TDLibFunctions:
             "@type": "setStickerSetThumbnail",
             "user_id": user_id,
             "name": name,
-            "thumbnail": thumbnail,
         }
 
+        if thumbnail is not None:
+            data["thumbnail"] = thumbnail
+
         return self.invoke(data)
 
     def setCustomEmojiStickerSetThumbnail(
@@ -13285,9 +13469,11 @@ class TDLibFunctions:
         data = {
             "@type": "setStickerMaskPosition",
             "sticker": sticker,
-            "mask_position": mask_position,
         }
 
+        if mask_position is not None:
+            data["mask_position"] = mask_position
+
         return self.invoke(data)
 
     def getMapThumbnailFile(
@@ -13370,9 +13556,11 @@ class TDLibFunctions:
 
         data = {
             "@type": "getPremiumFeatures",
-            "source": source,
         }
 
+        if source is not None:
+            data["source"] = source
+
         return self.invoke(data)
 
     def getPremiumStickerExamples(self) -> Result:
@@ -13669,7 +13857,7 @@ class TDLibFunctions:
             "phone_number_prefix": phone_number_prefix,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def getDeepLinkInfo(self, link: str) -> Result:
         """Returns information about a tg:// deep link\. Use "tg://need\_update\_for\_some\_feature" or "tg:some\_unsupported\_feature" for testing\. Returns a 404 error for unknown links\. Can be called before authorization
@@ -13953,7 +14141,7 @@ class TDLibFunctions:
             "log_stream": log_stream,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def getLogStream(self) -> Result:
         """Returns information about currently used log stream for internal logging of TDLib\. Can be called synchronously
@@ -13967,7 +14155,7 @@ class TDLibFunctions:
             "@type": "getLogStream",
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def setLogVerbosityLevel(self, new_verbosity_level: int) -> Result:
         """Sets the verbosity level of the internal logging of TDLib\. Can be called synchronously
@@ -13986,7 +14174,7 @@ class TDLibFunctions:
             "new_verbosity_level": new_verbosity_level,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def getLogVerbosityLevel(self) -> Result:
         """Returns current verbosity level of the internal logging of TDLib\. Can be called synchronously
@@ -14000,7 +14188,7 @@ class TDLibFunctions:
             "@type": "getLogVerbosityLevel",
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def getLogTags(self) -> Result:
         """Returns list of available TDLib internal log tags, for example, \["actor", "binlog", "connections", "notifications", "proxy"\]\. Can be called synchronously
@@ -14014,7 +14202,7 @@ class TDLibFunctions:
             "@type": "getLogTags",
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def setLogTagVerbosityLevel(self, tag: str, new_verbosity_level: int) -> Result:
         """Sets the verbosity level for a specified TDLib internal log tag\. Can be called synchronously
@@ -14037,7 +14225,7 @@ class TDLibFunctions:
             "new_verbosity_level": new_verbosity_level,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def getLogTagVerbosityLevel(self, tag: str) -> Result:
         """Returns current verbosity level for a specified TDLib internal log tag\. Can be called synchronously
@@ -14056,7 +14244,7 @@ class TDLibFunctions:
             "tag": tag,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def addLogMessage(self, verbosity_level: int, text: str) -> Result:
         """Adds a message to TDLib internal log\. Can be called synchronously
@@ -14079,7 +14267,7 @@ class TDLibFunctions:
             "text": text,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
 
     def getUserSupportInfo(self, user_id: int) -> Result:
         """Returns support information for the given user; for Telegram support only
@@ -14380,4 +14568,4 @@ class TDLibFunctions:
             "error": error,
         }
 
-        return self.invoke(data)
+        return self.execute(data)
@@ -1,15 +1,51 @@
+from array import array
+from base64 import b64encode
+from functools import partial
 from ctypes.util import find_library
 from ctypes import c_int, c_double, c_void_p, c_char_p, CDLL
 from logging import getLogger
 from typing import Union
-from platform import system
-from pkg_resources import resource_filename
-from ujson import loads, dumps
-
 
 logger = getLogger(__name__)
 
 
+def _default(obj):
+    # Packed integer lists (e.g. ``array("q", message_ids)``) are sent as JSON arrays
+    if isinstance(obj, array):
+        return obj.tolist()
+    # TDLib expects ``bytes`` fields as base64 strings
+    elif isinstance(obj, bytes):
+        return b64encode(obj).decode("ascii")
+
+    raise TypeError("{!r} is not JSON serializable".format(obj))
+
+
+try:
+    from orjson import dumps as orjson_dumps, loads
+
+    dumps = partial(orjson_dumps, default=_default)
+except ImportError:
+    from ujson import dumps as ujson_dumps, loads
+
+    def _encode_bytes(obj):
+        if isinstance(obj, bytes):
+            return b64encode(obj).decode("ascii")
+        elif isinstance(obj, dict):
+            return {k: _encode_bytes(v) for k, v in obj.items()}
+        elif isinstance(obj, (list, tuple)):
+            return [_encode_bytes(v) for v in obj]
+
+        return obj
+
+    def dumps(obj) -> bytes:
+        try:
+            return ujson_dumps(obj, default=_default, reject_bytes=True).encode("utf-8")
+        except TypeError:
+            # ujson < 6 rejects bytes instead of passing them to ``default``,
+            # so base64 them up front and try again
+            return ujson_dumps(_encode_bytes(obj), default=_default).encode("utf-8")
+
+
 class TdJson:
     def __init__(self, lib_path: str = None, verbosity: int = 2) -> None:
         """TdJson client
@@ -103,7 +139,7 @@ class TdJson:
         """
         try:
             if res := self._td_receive(self.client_id, c_double(timeout)):
-                return loads(res.decode("utf-8"))
+                return loads(res)
         except Exception:
             logger.exception("Exception while receiving")
             raise
@@ -116,7 +152,7 @@ class TdJson:
                 The request to be sent
         """
         try:
-            self._td_send(self.client_id, dumps(data).encode("utf-8"))
+            self._td_send(self.client_id, dumps(data))
         except Exception:
             logger.exception("Exception while sending", data)
             raise
@@ -131,8 +167,8 @@ class TdJson:
             :py:class:``dict``: The result of the request
         """
         try:
-            if res := self._td_execute(dumps(data).encode("utf-8")):
-                return loads(res.decode("utf-8"))
+            if res := self._td_execute(dumps(data)):
+                return loads(res)
         except Exception:
             logger.exception("Exception while executing")
             raise
@@ -1,10 +1,12 @@
-from os import urandom
-from binascii import hexlify
-from threading import Event
+from itertools import count
+from _thread import allocate_lock
 from ujson import dumps
 
 RETRY_AFTER_PREFEX = "Too Many Requests: retry after "
 
+# Request ids are ints so they never clash with the ``str`` keys of pending sent messages
+_request_ids = count(1)
+
 
 class Result:
     """Result object.
@@ -15,11 +17,23 @@ class Result:
 
     """
 
+    __slots__ = (
+        "id",
+        "request",
+        "is_processed",
+        "is_error",
+        "is_limited",
+        "limited_seconds",
+        "result",
+        "type",
+        "_lock",
+    )
+
     def __init__(
         self,
         request: dict,
     ) -> None:
-        self.id = hexlify(urandom(9)).decode()
+        self.id = next(_request_ids)
         request["@extra"] = {"id": self.id}
         self.request = request
         self.is_processed = False
@@ -28,7 +42,9 @@ class Result:
         self.limited_seconds = 0
         self.result = {}
         self.type = None
-        self._event = Event()
+        # Held until the result is set. Much cheaper to create than threading.Event
+        self._lock = allocate_lock()
+        self._lock.acquire()
 
     def __str__(self):
         if self.result == {}:
@@ -56,7 +72,12 @@ class Result:
 
     def wait(self, timeout: int = None) -> bool:
         """Wait for the result"""
-        return self._event.wait(timeout)
+        # Unlike ``Event.wait``, ``lock.acquire`` rejects negative timeouts
+        if self._lock.acquire(timeout=-1 if timeout is None else max(timeout, 0)):
+            self._lock.release()
+            return True
+
+        return False
 
     def set_result(self, result: dict) -> None:
         """Set the result
@@ -82,7 +103,8 @@ class Result:
         if "@extra" in result:
             del self.result["@extra"]
 
-        self._event.set()
+        if self._lock.locked():
+            self._lock.release()
 
     def reset(self) -> bool:
         """Reset the current result flags
@@ -91,10 +113,13 @@ class Result:
             :py:class:``bool``: ``True`` on success
         """
 
+        # Take the same lock back, so threads already waiting keep waiting for the new result
+        if self.is_processed:
+            self._lock.acquire()
+
         self.is_error = False
         self.is_processed = False
         self.result = {}
         self.type = None
-        self._event.clear()
 
         return True